@@ -19,6 +19,36 @@ VERB_MAP = {
 
 FILLERS = {"please", "could", "you", "can", "uh", "um"}
 
+# All simple trigger phrases compiled into one alternation; the named group
+# that matched tells us which intent fired.
+INTENT_RE = re.compile(
+    r"(?P<VOLUME_UP>volume|louder)"
+    r"|(?P<VOLUME_DOWN>quieter)"
+    r"|(?P<MUTE>mute)"
+    r"|(?P<BRIGHTNESS_UP>brighter)"
+    r"|(?P<BRIGHTNESS_DOWN>darker)"
+    r"|(?P<WIFI_ON>wifi on)"
+    r"|(?P<WIFI_OFF>wifi off)"
+    r"|(?P<BATTERY>battery)"
+    r"|(?P<PLAYPAUSE>play|pause)"
+    r"|(?P<NEXT>next)"
+    r"|(?P<PREVIOUS>previous)"
+)
+
+INTENT_ACTIONS = {
+    "VOLUME_UP": lambda: handlers.handle_volume(relative=10),
+    "VOLUME_DOWN": lambda: handlers.handle_volume(relative=-10),
+    "MUTE": handlers.handle_mute_toggle,
+    "BRIGHTNESS_UP": lambda: handlers.handle_brightness(relative=10),
+    "BRIGHTNESS_DOWN": lambda: handlers.handle_brightness(relative=-10),
+    "WIFI_ON": lambda: handlers.handle_wifi(True),
+    "WIFI_OFF": lambda: handlers.handle_wifi(False),
+    "BATTERY": handlers.handle_battery_status,
+    "PLAYPAUSE": lambda: handlers.handle_media("playpause"),
+    "NEXT": lambda: handlers.handle_media("next"),
+    "PREVIOUS": lambda: handlers.handle_media("previous"),
+}
+
 def normalize(text: str) -> str:
     text = text.lower()
     text = re.sub(r"[^\w\s]", " ", text)
@@ -41,37 +71,10 @@ def handle_voice_input(text: str) -> str:
 
     STATE.remember_command(norm)
 
-    # ---------------- Volume ----------------
-    if "volume" in norm or "louder" in norm:
-        return handlers.handle_volume(relative=10)
-    if "quieter" in norm:
-        return handlers.handle_volume(relative=-10)
-    if "mute" in norm:
-        return handlers.handle_mute_toggle()
-
-    # ---------------- Brightness ----------------
-    if "brighter" in norm:
-        return handlers.handle_brightness(relative=10)
-    if "darker" in norm:
-        return handlers.handle_brightness(relative=-10)
-
-    # ---------------- WiFi ----------------
-    if "wifi on" in norm:
-        return handlers.handle_wifi(True)
-    if "wifi off" in norm:
-        return handlers.handle_wifi(False)
-
-    # ---------------- Battery ----------------
-    if "battery" in norm:
-        return handlers.handle_battery_status()
-
-    # ---------------- Media ----------------
-    if "play" in norm or "pause" in norm:
-        return handlers.handle_media("playpause")
-    if "next" in norm:
-        return handlers.handle_media("next")
-    if "previous" in norm:
-        return handlers.handle_media("previous")
+    # Volume / brightness / wifi / battery / media: one regex pass
+    m = INTENT_RE.search(norm)
+    if m:
+        return INTENT_ACTIONS[m.lastgroup]()
 
     # ---------------- Open App ----------------
     if norm.startswith("open"):
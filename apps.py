@@ -130,4 +130,7 @@ def _load_user_overrides():
 
 
 # Run at import time so yochan.py gets the merged dict automatically
-_load_user_overrides()
\ No newline at end of file
+_load_user_overrides()
+
+# Intern keys so lookups with an interned phrase compare by identity
+APP_COMMANDS = {sys.intern(k): v for k, v in APP_COMMANDS.items()}
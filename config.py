@@ -60,6 +60,23 @@ ACCESS_KEY = os.getenv("ACCESS_KEY")
 WAKE_WORD_PATH = os.getenv("WAKE_WORD_PATH") or _autodetect_ppn()
 FUZZY_THRESHOLD = float(os.getenv("FUZZY_THRESHOLD", "0.7")) # Import and set the new threshold
 
+
+def _sensitivity(raw, default=0.9):
+    """Parse PORCUPINE_SENSITIVITY; bad values fall back, range is clamped."""
+    try:
+        value = float(raw) if raw not in (None, "") else default
+    except ValueError:
+        print(f"[config] Warning: invalid PORCUPINE_SENSITIVITY {raw!r}, using {default}.",
+              file=sys.stderr)
+        return default
+    if value != value:  # NaN
+        return default
+    return min(1.0, max(0.0, value))
+
+
+# 0.0–1.0: higher wakes more readily, lower cuts false wakes
+PORCUPINE_SENSITIVITY = _sensitivity(os.getenv("PORCUPINE_SENSITIVITY"))
+
 VOSK_SAMPLE_RATE = 16000  # keep constant for now
 
 
@@ -2,7 +2,6 @@
 from __future__ import annotations
 import json
 import queue
-import struct
 from typing import Callable, Optional
 
 import sounddevice as sd
@@ -68,8 +67,7 @@ class Listener:
                 # Optional wake-word stage
                 if self.use_porcupine and self.porcupine is not None:
                     try:
-                        pcm = struct.unpack_from("h" * (len(data) // 2), data)
-                        idx = self.porcupine.process(pcm)
+                        idx = self.porcupine.process(memoryview(data).cast("h"))
                         if idx < 0:
                             # no wake yet; ignore this chunk
                             continue
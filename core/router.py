@@ -1,5 +1,6 @@
 # core/router.py
 from __future__ import annotations
+import re
 
 import config as _cfg
 from utils.logger import get_logger
@@ -10,6 +11,11 @@ log = get_logger(__name__)
 backend = get_backend()
 ASSISTANT_DISPLAY_NAME = getattr(_cfg, "ASSISTANT_DISPLAY_NAME", "YoChan")
 
+_PCT_RE = re.compile(r"\d+")
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_UP_WORDS = frozenset({"up", "increase"})
+_DOWN_WORDS = frozenset({"down", "decrease"})
+
 
 def _feedback(msg: str) -> None:
     """Log + desktop notification for a command result."""
@@ -23,6 +29,16 @@ def _feedback(msg: str) -> None:
         pass
 
 
+def _get_percentage(t: str) -> int | None:
+    """Extract a 0-100 percentage, e.g. from "set volume to 50 percent"."""
+    # Fast path: the number is usually the last token ("... to 50")
+    tail = t.rsplit(" ", 1)[-1].rstrip("%")
+    if tail.isdigit():
+        return min(100, max(0, int(tail)))
+    m = _PCT_RE.search(t)
+    return min(100, max(0, int(m.group(0)))) if m else None
+
+
 def handle_text(text: str) -> None:
     """
     Very simple rule-based router from text -> commands.
@@ -31,35 +47,33 @@ def handle_text(text: str) -> None:
     t = (text or "").strip().lower()
     if not t:
         return
+    # Punctuation stripped as in ai_core.normalize, so "volume up!" still matches
+    tokens = frozenset(_PUNCT_RE.sub(" ", t).split())
 
     # Volume
     if t.startswith("set volume to"):
         # "set volume to 50 percent"
-        parts = t.split()
-        for part in reversed(parts):
-            if part.rstrip("%").isdigit():
-                pct = int(part.rstrip("%"))
-                _feedback(commands.volume_set(pct))
-                return
-    if "volume up" in t or "increase volume" in t:
+        pct = _get_percentage(t)
+        if pct is not None:
+            _feedback(commands.volume_set(pct))
+            return
+    if "volume" in tokens and tokens & _UP_WORDS:
         _feedback(commands.volume_change(+10))
         return
-    if "volume down" in t or "decrease volume" in t:
+    if "volume" in tokens and tokens & _DOWN_WORDS:
         _feedback(commands.volume_change(-10))
         return
 
     # Brightness
     if t.startswith("set brightness to"):
-        parts = t.split()
-        for part in reversed(parts):
-            if part.rstrip("%").isdigit():
-                pct = int(part.rstrip("%"))
-                _feedback(commands.brightness_set(pct))
-                return
-    if "brightness up" in t or "increase brightness" in t:
+        pct = _get_percentage(t)
+        if pct is not None:
+            _feedback(commands.brightness_set(pct))
+            return
+    if "brightness" in tokens and tokens & _UP_WORDS:
         _feedback(commands.brightness_change(+10))
         return
-    if "brightness down" in t or "decrease brightness" in t:
+    if "brightness" in tokens and tokens & _DOWN_WORDS:
         _feedback(commands.brightness_change(-10))
         return
 
@@ -101,7 +115,7 @@ def handle_text(text: str) -> None:
         return
 
     # Screenshot
-    if "screenshot" in t or "take screenshot" in t:
+    if "screenshot" in t:
         # commands.take_screenshot already shows a notification with the path,
         # but we still send a generic feedback too.
         path = commands.take_screenshot()
@@ -109,7 +123,7 @@ def handle_text(text: str) -> None:
         return
 
     # Clipboard
-    if "read clipboard" in t or "what is on clipboard" in t or "clipboard" in t:
+    if "clipboard" in t:
         clip = commands.read_clipboard()
         _feedback(f"Clipboard: {clip}")
         return
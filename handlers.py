@@ -3,22 +3,122 @@ import subprocess
 import shlex
 import sys
 import os
+import queue
+import threading
 
 from apps import APP_COMMANDS
 
+# Optional: talk to the notification daemon directly over D-Bus
+try:
+    from jeepney import DBusAddress, MessageType, new_method_call
+    from jeepney.io.blocking import open_dbus_connection
+except ImportError:
+    open_dbus_connection = None
+
 DEBUG = True
 
-def notify(stage: str, message: str, critical: bool = False):
-    print(f"[{stage}] {message}")
-    if critical:
+NOTIFICATIONS = None
+LOGIN1 = None
+if open_dbus_connection is not None:
+    NOTIFICATIONS = DBusAddress(
+        "/org/freedesktop/Notifications",
+        bus_name="org.freedesktop.Notifications",
+        interface="org.freedesktop.Notifications",
+    )
+    LOGIN1 = DBusAddress(
+        "/org/freedesktop/login1",
+        bus_name="org.freedesktop.login1",
+        interface="org.freedesktop.login1.Manager",
+    )
+
+_DBUS_CONNECTIONS = {}
+
+def _dbus(bus: str):
+    """Return a cached D-Bus connection for `bus`, or None if unavailable."""
+    if open_dbus_connection is None:
+        return None
+    if bus not in _DBUS_CONNECTIONS:
         try:
-            subprocess.Popen(["notify-send", "YoChan", f"[{stage}] {message}"])
+            _DBUS_CONNECTIONS[bus] = open_dbus_connection(bus=bus)
+        except Exception:
+            # Remember the failure so we don't retry on every call
+            _DBUS_CONNECTIONS[bus] = None
+    return _DBUS_CONNECTIONS[bus]
+
+def show_notification(summary: str, body: str = ""):
+    conn = _dbus("SESSION")
+    if conn is not None:
+        msg = new_method_call(
+            NOTIFICATIONS,
+            "Notify",
+            "susssasa{sv}i",
+            ("YoChan", 0, "", summary, body, [], {}, -1),
+        )
+        try:
+            conn.send_and_get_reply(msg)
+            return
         except Exception:
             pass
 
-def run(cmd):
+    # Fallback: no jeepney / no session bus
+    try:
+        subprocess.Popen(["notify-send", summary, body])
+    except Exception:
+        pass
+
+def login1_power(method: str) -> bool:
+    """
+    Call a logind power method ("PowerOff", "Reboot", "Suspend") over the
+    system bus. Returns False if the call could not be made or was refused
+    (e.g. PolicyKit wants interactive auth), so callers can fall back.
+    """
+    conn = _dbus("SYSTEM")
+    if conn is None:
+        return False
+    msg = new_method_call(LOGIN1, method, "b", (False,))
+    try:
+        reply = conn.send_and_get_reply(msg)
+    except Exception:
+        return False
+    return reply.header.message_type != MessageType.error
+
+# Desktop notifications go through one background thread, so a slow
+# notification daemon (or notify-send fork) never stalls the audio loop.
+_NOTIFY_QUEUE = queue.Queue()
+
+def _notification_worker():
+    pending = None
+    while True:
+        item = pending or _NOTIFY_QUEUE.get()
+        pending = None
+        # Collapse a backlog of identical notifications into one
+        while not _NOTIFY_QUEUE.empty():
+            pending = _NOTIFY_QUEUE.get_nowait()
+            if pending != item:
+                break
+            pending = None
+        show_notification(*item)
+
+threading.Thread(target=_notification_worker, name="notify", daemon=True).start()
+
+def queue_notification(summary: str, body: str = ""):
+    _NOTIFY_QUEUE.put_nowait((summary, body))
+
+def notify(stage: str, message: str, critical: bool = False):
+    print(f"[{stage}] {message}")
+    if critical:
+        queue_notification("YoChan", f"[{stage}] {message}")
+
+def run(cmd, detach: bool = False):
+    # Never wait on the child; `detach` also moves it into its own session
+    # so launched apps outlive the listener and don't share its signals.
     try:
-        subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=detach,
+        )
         return "Done."
     except Exception as e:
         return str(e)
@@ -59,7 +159,8 @@ def handle_media(action: str):
 # ---------------- Apps ----------------
 
 def handle_app_launch(name: str):
+    name = sys.intern(name)
     cmd = APP_COMMANDS.get(name) or APP_COMMANDS.get(name.lower())
     if not cmd:
         return f"App '{name}' not found."
-    return run(shlex.split(cmd))
+    return run(shlex.split(cmd), detach=True)
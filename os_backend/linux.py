@@ -64,18 +64,27 @@ class LinuxApps(AppController):
 class LinuxPower(PowerController):
     def action(self, name: str) -> str:
         n = (name or "").lower()
+        method = None
         if any(k in n for k in ("shutdown", "power off")):
-            cmd = ["systemctl", "poweroff"]
+            method, cmd = "PowerOff", ["systemctl", "poweroff"]
         elif any(k in n for k in ("reboot", "restart")):
-            cmd = ["systemctl", "reboot"]
+            method, cmd = "Reboot", ["systemctl", "reboot"]
         elif "log out" in n or "logout" in n:
             cmd = ["gnome-session-quit", "--logout", "--no-prompt"]
         elif any(k in n for k in ("suspend", "sleep", "hibernate")):
-            cmd = ["systemctl", "suspend"]
+            method, cmd = "Suspend", ["systemctl", "suspend"]
         else:
             return "Unknown power action."
-        rc, _, err = handlers.run_command(cmd, capture_output=True, check=False)
-        return "Power command sent." if rc == 0 else f"Power command failed: {err}"
+        # Same logind call systemctl makes, minus the process spawn
+        if method and handlers.login1_power(method):
+            return "Power command sent."
+        try:
+            res = subprocess.run(cmd, capture_output=True, text=True)
+        except OSError as e:
+            return f"Power command failed: {e}"
+        if res.returncode == 0:
+            return "Power command sent."
+        return f"Power command failed: {res.stderr.strip() or res.returncode}"
 
 
 # ---- Screen / Clipboard / Timer --------------------------------------------
@@ -129,7 +138,7 @@ class LinuxWindow(WindowContext):
 
 class LinuxNotify(NotificationCenter):
     def notify(self, summary: str, body: str = "") -> None:
-        handlers.show_notification(summary, body)
+        handlers.queue_notification(summary, body)
 
 
 # ---- Backend factory --------------------------------------------------------
@@ -112,7 +112,7 @@ echo ""
 # =====================================================
 echo "3) Installing Python packages in the venv..."
 pip install --upgrade pip >/dev/null 2>&1 || true
-pip install pvporcupine pvrecorder vosk python-dotenv numpy sounddevice
+pip install pvporcupine vosk python-dotenv numpy sounddevice jeepney
 
 echo "[OK] Python packages installed."
 echo ""
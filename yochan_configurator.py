@@ -11,11 +11,19 @@ A small GUI for:
    - LISTEN_DURATION
    - SHUTDOWN_COMMAND / REBOOT_COMMAND / SUSPEND_COMMAND / LOGOUT_COMMAND
    - FUZZY_THRESHOLD
+   - PORCUPINE_SENSITIVITY
    - ASSISTANT_NAME
 """
 
+import bisect
+import configparser
 import json
 import os
+import re
+import stat
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import tkinter as tk
 from tkinter import messagebox, filedialog, ttk
@@ -23,7 +31,7 @@ import webbrowser
 from yochan_update import (
     check_for_updates,
     apply_updates,
-    bootstrap_convert_to_git_clone,
+    bootstrap_convert_to_git_clone_async,
 )
 
 # Import project modules to discover paths
@@ -67,9 +75,25 @@ ENV_KEYS = [
     "SUSPEND_COMMAND",
     "LOGOUT_COMMAND",
     "FUZZY_THRESHOLD",
+    "PORCUPINE_SENSITIVITY",
     "ASSISTANT_NAME",
 ]
 
+# Whole Exec= arguments that start with a field code (%U, %F, %i, ...)
+_EXEC_PLACEHOLDER_RE = re.compile(r"(?:^|\s+)%\S*")
+
+# Save-time validation: LISTEN_DURATION >= 1; FUZZY_THRESHOLD and
+# PORCUPINE_SENSITIVITY between 0.0 and 1.0
+_DURATION_RE = re.compile(r"^0*[1-9]\d*$")
+_THRESHOLD_RE = re.compile(r"^(?:0*1(?:\.0*)?|0*\.\d+|0+\.?)$")
+
+
+# KEY=VALUE, whitespace around key/value ignored
+_ENV_RE = re.compile(r"^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*?)\s*$")
+
+# path -> ((st_mtime_ns, st_size), parsed env)
+_env_cache = {}
+
 
 def read_env_file(path: Path) -> dict:
     """
@@ -77,84 +101,141 @@ def read_env_file(path: Path) -> dict:
     - Lines like KEY=VALUE
     - Ignores blank lines and comments
     - Returns dict of key->value (strings)
+
+    Results are cached until the file's mtime/size change;
+    read_env_file.cache_clear() forces a re-read.
     """
     env = {}
-    if not path.exists():
+    try:
+        st = path.stat()
+    except OSError:
         return env
 
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _env_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return dict(cached[1])
+
     try:
         with path.open("r", encoding="utf-8") as f:
             for line in f:
-                line = line.rstrip("\n")
-                stripped = line.strip()
-                if not stripped or stripped.startswith("#"):
-                    continue
-                if "=" not in stripped:
-                    continue
-                key, value = stripped.split("=", 1)
-                env[key.strip()] = value.strip()
+                # Blank lines and comments simply don't match
+                m = _ENV_RE.match(line)
+                if m:
+                    env[m.group(1)] = m.group(2)
     except Exception as e:
         print(f"[Configurator] Error reading .env: {e}")
-    return env
+        return env
+
+    _env_cache[path] = (stamp, env)
+    return dict(env)
 
 
-def write_env_file(path: Path, updates: dict):
+read_env_file.cache_clear = _env_cache.clear
+
+
+def write_env_file(path: Path, updates: dict, current=None):
     """
     Update specific keys in .env while preserving other lines
     and comments as much as possible.
-    """
-    lines = []
-    existing_env = {}
-    if path.exists():
-        with path.open("r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        # Build map of existing keys
-        for line in lines:
-            stripped = line.strip()
-            if not stripped or stripped.startswith("#") or "=" not in stripped:
-                continue
-            key, value = stripped.split("=", 1)
-            existing_env[key.strip()] = value.strip()
 
-    # Apply updates into existing_env
-    for k, v in updates.items():
-        existing_env[k] = v
+    Streams the old file into a sibling .tmp in one pass, then
+    swaps it into place with os.replace().
 
-    # Rebuild lines:
-    new_lines = []
+    The pass also records what the new file parses to, which becomes the
+    read_env_file cache entry. If `current` (the caller's parsed env dict)
+    is given it is brought up to date in place, so callers never need to
+    re-read .env after saving.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    update_keys = frozenset(updates)
     handled_keys = set()
+    new_env = {}
 
-    for line in lines:
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#") or "=" not in stripped:
-            new_lines.append(line)
-            continue
-
-        key, _ = stripped.split("=", 1)
-        key_stripped = key.strip()
-
-        if key_stripped in updates:
-            # Replace this line
-            value = existing_env.get(key_stripped, "")
-            new_lines.append(f"{key_stripped}={value}\n")
-            handled_keys.add(key_stripped)
-        else:
-            new_lines.append(line)
-
-    # Any new keys that were not in the file get appended
-    for k in updates.keys():
-        if k not in handled_keys:
-            value = existing_env.get(k, "")
-            new_lines.append(f"{k}={value}\n")
-
-    # Write back
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as f:
-            f.writelines(new_lines)
+        # .env holds ACCESS_KEY: create the temp file with its final mode
+        # (the user's existing one, else 0600) before any data is written
+        mode = stat.S_IMODE(path.stat().st_mode) if path.exists() else 0o600
+        tmp.unlink(missing_ok=True)
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, mode)  # undo umask
+        with os.fdopen(fd, "w", encoding="utf-8") as out:
+            if path.exists():
+                with path.open("r", encoding="utf-8") as f:
+                    for line in f:
+                        # Blank lines and most comments can't hold a key
+                        m = _ENV_RE.match(line) if "=" in line else None
+                        if m:
+                            key = m.group(1)
+                            if key in update_keys:
+                                # Replace this line
+                                out.write(f"{key}={updates[key]}\n")
+                                handled_keys.add(key)
+                                new_env[key] = updates[key]
+                                continue
+                            new_env[key] = m.group(2)
+                        if not line.endswith("\n"):
+                            line += "\n"
+                        out.write(line)
+            elif current:
+                # No file yet: seed it with what the caller already has
+                for k, v in current.items():
+                    if k not in updates:
+                        out.write(f"{k}={v}\n")
+                        new_env[k] = v
+
+            # Any new keys that were not in the file get appended
+            for k, v in updates.items():
+                if k not in handled_keys:
+                    out.write(f"{k}={v}\n")
+                    new_env[k] = v
+
+        os.replace(tmp, path)
     except Exception as e:
+        # The original .env is untouched; just drop the partial temp file
+        tmp.unlink(missing_ok=True)
         messagebox.showerror("Save error", f"Could not write .env:\n{e}")
+        return
+
+    try:
+        st = path.stat()
+        _env_cache[path] = ((st.st_mtime_ns, st.st_size), new_env)
+    except OSError:
+        _env_cache.pop(path, None)
+
+    if current is not None:
+        current.clear()
+        current.update(new_env)
+
+
+@lru_cache(maxsize=64)
+def _derive_assistant_name(explicit: str, wake_path: str) -> str:
+    """
+    Display name for the preview, e.g. "Yo Chan! Assistant":
+    the explicit ASSISTANT_NAME if given, else derived from the .ppn filename.
+    """
+    if explicit:
+        base = explicit
+    else:
+        base = ""
+        if wake_path:
+            filename = os.path.basename(wake_path)
+            name, _ext = os.path.splitext(filename)
+            # clean up common filename patterns: underscores/dashes → spaces
+            name = name.replace("_", " ").replace("-", " ").strip()
+            # strip typical porcupine suffixes like "_linux"
+            for suffix in (" linux", "mac", "windows"):
+                if name.lower().endswith(suffix):
+                    name = name[: -len(suffix)].strip()
+            base = name.title()
+
+    base = base.strip() or "Assistant"
+
+    if base.endswith("!"):
+        return f"{base} Assistant"
+    return f"{base}! Assistant"
 
 
 # ----------------- APP MAPPER TAB -----------------
@@ -166,17 +247,27 @@ class AppMapperFrame(tk.Frame):
     Also provides a scanner for installed desktop apps (with search).
     """
 
+    # Shared across scans: path -> (st_mtime_ns, parsed app dict or None)
+    _desktop_cache = OrderedDict()
+    DESKTOP_CACHE_MAX = 4096
+
+    # Scans run here, one at a time, so _desktop_cache has a single writer
+    _scan_executor = ThreadPoolExecutor(max_workers=1)
+
     def __init__(self, master):
         super().__init__(master)
 
         self.mappings = {}
+        self._sorted_keys = []   # phrases in display order, kept sorted
         self.selected_key = None
 
         # For scanner
         self.scanned_apps = []           # full list: {name, exec, path}
         self._scanner_current_apps = []  # currently displayed subset
         self.scanner_window = None
-        self.scanner_listbox = None
+        self.scanner_tree = None
+        self.scanner_hint_label = None
+        self._filter_after_id = None
         self.scanner_search_var = tk.StringVar()
 
         # Left side: list of phrases
@@ -185,9 +276,11 @@ class AppMapperFrame(tk.Frame):
 
         tk.Label(left_frame, text="Spoken Phrases").pack(anchor="w")
 
-        self.listbox = tk.Listbox(left_frame, width=30)
-        self.listbox.pack(fill=tk.BOTH, expand=True)
-        self.listbox.bind("<<ListboxSelect>>", self.on_select)
+        # Treeview item ids are the phrases themselves
+        self.phrase_tree = ttk.Treeview(left_frame, show="tree", selectmode="browse")
+        self.phrase_tree.column("#0", width=220)
+        self.phrase_tree.pack(fill=tk.BOTH, expand=True)
+        self.phrase_tree.bind("<<TreeviewSelect>>", self.on_select)
 
         # Right side: details and buttons
         right_frame = tk.Frame(self)
@@ -234,15 +327,16 @@ class AppMapperFrame(tk.Frame):
         self.status_label.config(text=text)
 
     def refresh_listbox(self):
-        self.listbox.delete(0, tk.END)
-        for key in sorted(self.mappings.keys()):
-            self.listbox.insert(tk.END, key)
+        tree = self.phrase_tree
+        tree.delete(*tree.get_children())
+        for key in self._sorted_keys:
+            tree.insert("", tk.END, iid=key, text=key)
 
     def on_select(self, event):
-        if not self.listbox.curselection():
+        selection = self.phrase_tree.selection()
+        if not selection:
             return
-        index = self.listbox.curselection()[0]
-        key = self.listbox.get(index)
+        key = selection[0]
         self.selected_key = key
 
         self.phrase_entry.delete(0, tk.END)
@@ -263,33 +357,43 @@ class AppMapperFrame(tk.Frame):
             messagebox.showwarning("Missing command", "Please enter a command to execute.")
             return
 
+        if phrase not in self.mappings:
+            # Insert the new row in place instead of re-sorting everything
+            index = bisect.bisect_left(self._sorted_keys, phrase)
+            self._sorted_keys.insert(index, phrase)
+            self.phrase_tree.insert("", index, iid=phrase, text=phrase)
         self.mappings[phrase] = cmd
-        self.refresh_listbox()
         self.set_status(f"Mapping saved: '{phrase}' → {cmd}")
 
     def delete_selected(self):
-        if not self.listbox.curselection():
+        selection = self.phrase_tree.selection()
+        if not selection:
             messagebox.showinfo("No selection", "Select a phrase to delete.")
             return
 
-        index = self.listbox.curselection()[0]
-        key = self.listbox.get(index)
+        key = selection[0]
 
         if messagebox.askyesno("Delete mapping", f"Delete mapping for '{key}'?"):
             self.mappings.pop(key, None)
-            self.refresh_listbox()
+            self._sorted_keys.remove(key)
+            self.phrase_tree.delete(key)
             self.phrase_entry.delete(0, tk.END)
             self.command_entry.delete(0, tk.END)
             self.selected_key = None
             self.set_status(f"Deleted mapping for '{key}'")
 
     def save_to_disk(self):
+        # Serialize in one go and write once; swap in atomically like .env
+        payload = json.dumps(self.mappings, indent=4, ensure_ascii=False).encode("utf-8")
+        tmp = CONFIG_PATH_JSON.with_name(CONFIG_PATH_JSON.name + ".tmp")
         try:
             CONFIG_PATH_JSON.parent.mkdir(parents=True, exist_ok=True)
-            with CONFIG_PATH_JSON.open("w", encoding="utf-8") as f:
-                json.dump(self.mappings, f, indent=4, ensure_ascii=False)
+            with tmp.open("wb") as f:
+                f.write(payload)
+            os.replace(tmp, CONFIG_PATH_JSON)
             self.set_status(f"Saved {len(self.mappings)} mappings to {CONFIG_PATH_JSON}")
         except Exception as e:
+            tmp.unlink(missing_ok=True)
             messagebox.showerror("Save error", f"Could not save config:\n{e}")
 
     def reload_from_disk(self, initial=False):
@@ -314,6 +418,7 @@ class AppMapperFrame(tk.Frame):
         else:
             self.mappings = {}
 
+        self._sorted_keys = sorted(self.mappings)
         self.refresh_listbox()
         if not initial:
             self.set_status(f"Reloaded {len(self.mappings)} mappings from disk.")
@@ -321,25 +426,23 @@ class AppMapperFrame(tk.Frame):
     # ----- APP SCANNER + SEARCH -----
 
     def open_app_scanner(self):
-        """Open a popup that lists installed desktop apps (.desktop files)."""
-        self.scanned_apps = self._scan_installed_apps()
-        self._scanner_current_apps = list(self.scanned_apps)
-
-        if not self.scanned_apps:
-            messagebox.showinfo(
-                "No apps found",
-                "Could not find any .desktop files in standard locations.\n"
-                "Checked /usr/share/applications and ~/.local/share/applications.",
-            )
-            return
+        """
+        Open a popup that lists installed desktop apps (.desktop files).
 
+        The window opens empty right away; the scan runs on a worker
+        thread and the list is filled in when it finishes.
+        """
         if self.scanner_window is not None and tk.Toplevel.winfo_exists(self.scanner_window):
             self.scanner_window.lift()
             return
 
+        self.scanned_apps = []
+        self._scanner_current_apps = []
+
         self.scanner_window = tk.Toplevel(self)
         self.scanner_window.title("Installed Applications")
         self.scanner_window.geometry("650x450")
+        self.scanner_window.bind("<Destroy>", self._on_scanner_destroy)
 
         # Top: search box
         search_frame = tk.Frame(self.scanner_window)
@@ -356,24 +459,30 @@ class AppMapperFrame(tk.Frame):
         list_frame = tk.Frame(self.scanner_window)
         list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        self.scanner_listbox = tk.Listbox(list_frame)
-        self.scanner_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scanner_tree = ttk.Treeview(
+            list_frame,
+            columns=("exec",),
+            show="tree headings",
+            selectmode="browse",
+        )
+        self.scanner_tree.heading("#0", text="Name")
+        self.scanner_tree.heading("exec", text="Command")
+        self.scanner_tree.column("#0", width=220)
+        self.scanner_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        scrollbar = tk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.scanner_listbox.yview)
+        scrollbar = tk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.scanner_tree.yview)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.scanner_listbox.config(yscrollcommand=scrollbar.set)
-
-        # Populate listbox initially
-        self._refresh_scanner_listbox()
+        self.scanner_tree.config(yscrollcommand=scrollbar.set)
 
-        # Label hint
-        tk.Label(
+        # Label hint (doubles as progress text while scanning)
+        self.scanner_hint_label = tk.Label(
             self.scanner_window,
-            text="Double-click an app or select it and press 'Use Selected'.",
-        ).pack(anchor="w", padx=10, pady=(0, 5))
+            text="Scanning installed applications…",
+        )
+        self.scanner_hint_label.pack(anchor="w", padx=10, pady=(0, 5))
 
         # Bind double-click
-        self.scanner_listbox.bind("<Double-Button-1>", self._use_selected_app_from_scanner)
+        self.scanner_tree.bind("<Double-Button-1>", self._use_selected_app_from_scanner)
 
         # Buttons
         btn_frame = tk.Frame(self.scanner_window)
@@ -391,24 +500,87 @@ class AppMapperFrame(tk.Frame):
             command=self.scanner_window.destroy,
         ).grid(row=0, column=1, padx=5)
 
+        future = self._scan_executor.submit(self._scan_installed_apps)
+        self._poll_scan(future, self.scanner_window)
+
+    def _poll_scan(self, future, window):
+        """Wait for the background scan without blocking the Tk event loop."""
+        if not future.done():
+            self.after(50, self._poll_scan, future, window)
+            return
+
+        # User closed (or reopened) the scanner before results arrived
+        if window is not self.scanner_window or not tk.Toplevel.winfo_exists(window):
+            return
+
+        try:
+            self.scanned_apps = future.result()
+        except Exception:
+            self.scanned_apps = []
+
+        if not self.scanned_apps:
+            window.destroy()
+            messagebox.showinfo(
+                "No apps found",
+                "Could not find any .desktop files in standard locations.\n"
+                "Checked /usr/share/applications and ~/.local/share/applications.",
+            )
+            return
+
+        self.scanner_hint_label.config(
+            text="Double-click an app or select it and press 'Use Selected'."
+        )
+        # Populate list, honouring anything typed while we were scanning
+        self._do_filter()
+
     def _scan_installed_apps(self):
         """
         Scan common .desktop directories and return a list of:
         { 'name': ..., 'exec': ..., 'path': ... }
         """
-        results = []
         desktop_dirs = [
             Path("/usr/share/applications"),
             Path.home() / ".local/share/applications",
         ]
 
+        files = []
         for d in desktop_dirs:
             if not d.is_dir():
                 continue
-            for desktop_file in d.glob("*.desktop"):
-                app_info = self._parse_desktop_file(desktop_file)
-                if app_info:
-                    results.append(app_info)
+            for desktop_file in d.iterdir():
+                if desktop_file.suffix != ".desktop" or not desktop_file.is_file():
+                    continue
+                files.append(desktop_file)
+
+        # Reuse parses of files whose mtime hasn't changed since the last scan
+        cache = AppMapperFrame._desktop_cache
+        results = []
+        stale = []
+        for desktop_file in files:
+            try:
+                mtime = desktop_file.stat().st_mtime_ns
+            except OSError:
+                continue
+            hit = cache.get(desktop_file)
+            if hit is not None and hit[0] == mtime:
+                cache.move_to_end(desktop_file)
+                if hit[1]:
+                    results.append(hit[1])
+            else:
+                stale.append((desktop_file, mtime))
+
+        if stale:
+            # Parsing is mostly small-file IO, so threads overlap the reads
+            with ThreadPoolExecutor(max_workers=min(16, len(stale))) as ex:
+                parsed = ex.map(self._parse_desktop_file, [f for f, _ in stale])
+                for (desktop_file, mtime), app_info in zip(stale, parsed):
+                    cache[desktop_file] = (mtime, app_info)
+                    cache.move_to_end(desktop_file)
+                    if app_info:
+                        results.append(app_info)
+
+            while len(cache) > AppMapperFrame.DESKTOP_CACHE_MAX:
+                cache.popitem(last=False)
 
         results.sort(key=lambda a: a["name"].lower())
         return results
@@ -418,34 +590,30 @@ class AppMapperFrame(tk.Frame):
         Parse a .desktop file to extract Name= and Exec=.
         Ignore NoDisplay=true entries.
         """
-        name = None
-        exec_cmd = None
-        nodisplay = False
+        # .desktop files are INI; keys are case-sensitive and may repeat
+        cp = configparser.RawConfigParser(strict=False, interpolation=None, delimiters=("=",))
+        cp.optionxform = str
 
         try:
-            with path.open("r", encoding="utf-8", errors="ignore") as f:
-                for line in f:
-                    stripped = line.strip()
-                    if not stripped or stripped.startswith("#"):
-                        continue
-
-                    if stripped.startswith("Name=") and name is None:
-                        name = stripped[len("Name="):].strip()
-
-                    elif stripped.startswith("Exec=") and exec_cmd is None:
-                        exec_cmd = stripped[len("Exec="):].strip()
-
-                    elif stripped.startswith("NoDisplay="):
-                        if "true" in stripped.split("=", 1)[1].strip().lower():
-                            nodisplay = True
+            with path.open("r", encoding="utf-8-sig", errors="ignore") as f:
+                try:
+                    cp.read_file(f)
+                except configparser.ParsingError:
+                    # Stray lines without '='; everything else was still parsed
+                    pass
+
+            if not cp.has_section("Desktop Entry"):
+                return None
+            section = cp["Desktop Entry"]
+            name = section.get("Name")
+            exec_cmd = section.get("Exec")
+            nodisplay = section.getboolean("NoDisplay", fallback=False)
 
             if not name or not exec_cmd or nodisplay:
                 return None
 
             # Clean Exec command: remove placeholders like %U, %F, etc.
-            exec_parts = exec_cmd.split()
-            clean_parts = [p for p in exec_parts if not p.startswith("%")]
-            exec_clean = " ".join(clean_parts).strip()
+            exec_clean = _EXEC_PLACEHOLDER_RE.sub("", exec_cmd).strip()
 
             if not exec_clean:
                 return None
@@ -454,46 +622,65 @@ class AppMapperFrame(tk.Frame):
                 "name": name,
                 "exec": exec_clean,
                 "path": str(path),
+                # Precomputed for the search filter; \x1f keeps a query from
+                # matching across the name/exec boundary
+                "_search_key": (name + "\x1f" + exec_clean).casefold(),
             }
 
-        except Exception:
+        except (configparser.Error, OSError, ValueError):
             return None
 
-    def _refresh_scanner_listbox(self):
-        """Refresh the listbox using self._scanner_current_apps."""
-        if self.scanner_listbox is None:
+    def _on_scanner_destroy(self, event):
+        """Scanner window closed: drop a pending filter pass and the dead tree."""
+        # <Destroy> also fires for every child widget of the window
+        if event.widget is not self.scanner_window:
+            return
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+        self.scanner_tree = None
+
+    def _refresh_scanner_tree(self):
+        """Refresh the tree using self._scanner_current_apps (iid = index)."""
+        tree = self.scanner_tree
+        if tree is None or not tree.winfo_exists():
             return
 
-        self.scanner_listbox.delete(0, tk.END)
-        for app in self._scanner_current_apps:
-            display = f"{app['name']}  —  {app['exec']}"
-            self.scanner_listbox.insert(tk.END, display)
+        tree.delete(*tree.get_children())
+        for i, app in enumerate(self._scanner_current_apps):
+            tree.insert("", tk.END, iid=str(i), text=app["name"], values=(app["exec"],))
 
     def _filter_scanner_list(self, *args):
+        """Search box trace: coalesce a burst of keystrokes into one filter pass."""
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(120, self._do_filter)
+
+    def _do_filter(self):
         """Filter scanned apps based on search box content."""
-        query = self.scanner_search_var.get().strip().lower()
+        self._filter_after_id = None
+        query = self.scanner_search_var.get().strip().casefold()
         if not query:
             self._scanner_current_apps = list(self.scanned_apps)
         else:
             self._scanner_current_apps = [
-                app for app in self.scanned_apps
-                if query in app["name"].lower() or query in app["exec"].lower()
+                app for app in self.scanned_apps if query in app["_search_key"]
             ]
-        self._refresh_scanner_listbox()
+        self._refresh_scanner_tree()
 
     def _use_selected_app_from_scanner(self, event=None):
         """Use currently selected app from the scanner window to pre-fill phrase/command."""
         if self.scanner_window is None or not tk.Toplevel.winfo_exists(self.scanner_window):
             return
-        if self.scanner_listbox is None:
+        if self.scanner_tree is None:
             return
 
-        selection = self.scanner_listbox.curselection()
+        selection = self.scanner_tree.selection()
         if not selection:
             messagebox.showinfo("No selection", "Please select an application from the list.")
             return
 
-        index = selection[0]
+        index = int(selection[0])
         if index < 0 or index >= len(self._scanner_current_apps):
             return
 
@@ -559,11 +746,9 @@ class EnvConfigFrame(tk.Frame):
             ):
                 return
 
-            ok, msg = bootstrap_convert_to_git_clone(repo_dir)
-            if ok:
-                messagebox.showinfo("YoChan Updates", msg)
-            else:
-                messagebox.showerror("YoChan Updates", msg)
+            # Clone runs in the background; keep the window responsive
+            self.config(cursor="watch")
+            self._poll_bootstrap(bootstrap_convert_to_git_clone_async(repo_dir))
             return
 
         # Case 2: git repo, no updates
@@ -589,6 +774,23 @@ class EnvConfigFrame(tk.Frame):
         else:
             messagebox.showerror("YoChan Updates", msg)
 
+    def _poll_bootstrap(self, future):
+        """Wait for the git-clone conversion without blocking the Tk event loop."""
+        if not future.done():
+            self.after(100, self._poll_bootstrap, future)
+            return
+
+        self.config(cursor="")
+        try:
+            ok, msg = future.result()
+        except Exception as e:
+            ok, msg = False, f"Conversion failed:\n{e}"
+
+        if ok:
+            messagebox.showinfo("YoChan Updates", msg)
+        else:
+            messagebox.showerror("YoChan Updates", msg)
+
     # ---------- MODELS / WAKE WORD TAB ----------
 
     def _build_models_tab(self):
@@ -597,9 +799,10 @@ class EnvConfigFrame(tk.Frame):
         row = 0
 
         # MODEL_PATH
-        tk.Label(f, text="Vosk MODEL_PATH (folder):").grid(row=row, column=0, sticky="w")
+        tk.Label(f, text="Vosk MODEL_PATH (folder; a small model is recommended):").grid(row=row, column=0, sticky="w")
         row += 1
-        self.model_entry = tk.Entry(f, width=60)
+        self.model_var = tk.StringVar()
+        self.model_entry = tk.Entry(f, width=60, textvariable=self.model_var)
         self.model_entry.grid(row=row, column=0, sticky="we", pady=(0, 5))
         tk.Button(f, text="Browse Folder", command=self.browse_model_dir).grid(row=row, column=1, padx=5)
         row += 1
@@ -607,7 +810,8 @@ class EnvConfigFrame(tk.Frame):
         # WAKE_WORD_PATH
         tk.Label(f, text="Porcupine WAKE_WORD_PATH (.ppn file):").grid(row=row, column=0, sticky="w")
         row += 1
-        self.wake_entry = tk.Entry(f, width=60)
+        self.wake_var = tk.StringVar()
+        self.wake_entry = tk.Entry(f, width=60, textvariable=self.wake_var)
         self.wake_entry.grid(row=row, column=0, sticky="we", pady=(0, 5))
         tk.Button(f, text="Browse File", command=self.browse_wake_file).grid(row=row, column=1, padx=5)
         row += 1
@@ -615,7 +819,8 @@ class EnvConfigFrame(tk.Frame):
         # ACCESS_KEY
         tk.Label(f, text="Picovoice ACCESS_KEY:").grid(row=row, column=0, sticky="w")
         row += 1
-        self.access_entry = tk.Entry(f, width=60, show="*")
+        self.access_var = tk.StringVar()
+        self.access_entry = tk.Entry(f, width=60, show="*", textvariable=self.access_var)
         self.access_entry.grid(row=row, column=0, sticky="we", pady=(0, 5))
         row += 1
 
@@ -625,7 +830,8 @@ class EnvConfigFrame(tk.Frame):
             text="Assistant name (optional, overrides name derived from wake word):"
         ).grid(row=row, column=0, sticky="w")
         row += 1
-        self.assistant_name_entry = tk.Entry(f, width=60)
+        self.assistant_name_var = tk.StringVar()
+        self.assistant_name_entry = tk.Entry(f, width=60, textvariable=self.assistant_name_var)
         self.assistant_name_entry.grid(row=row, column=0, sticky="we", pady=(0, 5))
         row += 1
 
@@ -665,8 +871,8 @@ class EnvConfigFrame(tk.Frame):
 
         f.columnconfigure(0, weight=1)
 
-        # Fill current values + preview
-        self.reload_from_env()
+        # Fill current values + preview (from the env read in __init__)
+        self._fill_models_fields()
 
     # --- MODEL BROWSER / LINKS HANDLERS ---
 
@@ -676,8 +882,7 @@ class EnvConfigFrame(tk.Frame):
             initialdir=self.env_values.get("MODEL_PATH", str(BASE_DIR)),
         )
         if directory:
-            self.model_entry.delete(0, tk.END)
-            self.model_entry.insert(0, directory)
+            self.model_var.set(directory)
 
     def browse_wake_file(self):
         file_path = filedialog.askopenfilename(
@@ -686,8 +891,7 @@ class EnvConfigFrame(tk.Frame):
             initialdir=self.env_values.get("WAKE_WORD_PATH", str(BASE_DIR)),
         )
         if file_path:
-            self.wake_entry.delete(0, tk.END)
-            self.wake_entry.insert(0, file_path)
+            self.wake_var.set(file_path)
         self.update_assistant_preview()
 
     def open_vosk_models_page(self):
@@ -703,35 +907,9 @@ class EnvConfigFrame(tk.Frame):
         - otherwise derive from WAKE_WORD_PATH filename
         - fallback to 'Assistant'
         """
-        # 1) explicit assistant name, if any
-        explicit = self.assistant_name_entry.get().strip() if hasattr(self, "assistant_name_entry") else ""
-
-        if explicit:
-            base = explicit
-        else:
-            # 2) derive from wake word path
-            wake_path = self.wake_entry.get().strip() if hasattr(self, "wake_entry") else ""
-            base = ""
-            if wake_path:
-                filename = os.path.basename(wake_path)
-                name, _ext = os.path.splitext(filename)
-                # clean up common filename patterns: underscores/dashes → spaces
-                name = name.replace("_", " ").replace("-", " ").strip()
-                # strip typical porcupine suffixes like "_linux"
-                for suffix in (" linux", "mac", "windows"):
-                    if name.lower().endswith(suffix):
-                        name = name[: -len(suffix)].strip()
-                base = name.title()
-
-            if not base:
-                base = "Assistant"
-
-        base = base.strip() or "Assistant"
-
-        if base.endswith("!"):
-            display = f"{base} Assistant"
-        else:
-            display = f"{base}! Assistant"
+        explicit = self.assistant_name_var.get().strip() if hasattr(self, "assistant_name_var") else ""
+        wake_path = self.wake_var.get().strip() if hasattr(self, "wake_var") else ""
+        display = _derive_assistant_name(explicit, wake_path)
 
         if hasattr(self, "assistant_preview_label"):
             self.assistant_preview_label.config(
@@ -739,32 +917,29 @@ class EnvConfigFrame(tk.Frame):
             )
 
     def reload_from_env(self):
+        """'Reload from .env' button: force a real re-read from disk."""
+        read_env_file.cache_clear()
         self.env_values = read_env_file(ENV_PATH)
+        self._fill_models_fields()
 
-        self.model_entry.delete(0, tk.END)
-        self.model_entry.insert(0, self.env_values.get("MODEL_PATH", ""))
-
-        self.wake_entry.delete(0, tk.END)
-        self.wake_entry.insert(0, self.env_values.get("WAKE_WORD_PATH", ""))
-
-        self.access_entry.delete(0, tk.END)
-        self.access_entry.insert(0, self.env_values.get("ACCESS_KEY", ""))
-
-        self.assistant_name_entry.delete(0, tk.END)
-        self.assistant_name_entry.insert(0, self.env_values.get("ASSISTANT_NAME", ""))
+    def _fill_models_fields(self):
+        self.model_var.set(self.env_values.get("MODEL_PATH", ""))
+        self.wake_var.set(self.env_values.get("WAKE_WORD_PATH", ""))
+        self.access_var.set(self.env_values.get("ACCESS_KEY", ""))
+        self.assistant_name_var.set(self.env_values.get("ASSISTANT_NAME", ""))
 
         # update preview label
         self.update_assistant_preview()
 
     def save_models_to_env(self):
         updates = {
-            "MODEL_PATH": self.model_entry.get().strip(),
-            "WAKE_WORD_PATH": self.wake_entry.get().strip(),
-            "ACCESS_KEY": self.access_entry.get().strip(),
-            "ASSISTANT_NAME": self.assistant_name_entry.get().strip(),
+            "MODEL_PATH": self.model_var.get().strip(),
+            "WAKE_WORD_PATH": self.wake_var.get().strip(),
+            "ACCESS_KEY": self.access_var.get().strip(),
+            "ASSISTANT_NAME": self.assistant_name_var.get().strip(),
         }
 
-        write_env_file(ENV_PATH, updates)
+        write_env_file(ENV_PATH, updates, current=self.env_values)
         self.update_assistant_preview()
         messagebox.showinfo("Saved", "Model / wake word / assistant settings saved to .env.")
 
@@ -777,42 +952,56 @@ class EnvConfigFrame(tk.Frame):
         # LISTEN_DURATION
         tk.Label(f, text="LISTEN_DURATION (seconds to listen after wake word):").grid(row=row, column=0, sticky="w")
         row += 1
-        self.listen_entry = tk.Entry(f, width=10)
+        self.listen_var = tk.StringVar()
+        self.listen_entry = tk.Entry(f, width=10, textvariable=self.listen_var)
         self.listen_entry.grid(row=row, column=0, sticky="w", pady=(0, 10))
         row += 1
 
         # FUZZY_THRESHOLD
         tk.Label(f, text="FUZZY_THRESHOLD (0.0 to 1.0, 1.0 = Exact Match):").grid(row=row, column=0, sticky="w")
         row += 1
-        self.fuzzy_entry = tk.Entry(f, width=10)
+        self.fuzzy_var = tk.StringVar()
+        self.fuzzy_entry = tk.Entry(f, width=10, textvariable=self.fuzzy_var)
         self.fuzzy_entry.grid(row=row, column=0, sticky="w", pady=(0, 10))
         row += 1
 
+        # PORCUPINE_SENSITIVITY
+        tk.Label(f, text="PORCUPINE_SENSITIVITY (0.0 to 1.0, lower = fewer false wakes):").grid(row=row, column=0, sticky="w")
+        row += 1
+        self.sensitivity_var = tk.StringVar()
+        self.sensitivity_entry = tk.Entry(f, width=10, textvariable=self.sensitivity_var)
+        self.sensitivity_entry.grid(row=row, column=0, sticky="w", pady=(0, 10))
+        row += 1
+
         # Power commands
         tk.Label(f, text="Power commands (optional overrides):").grid(row=row, column=0, sticky="w")
         row += 1
 
         tk.Label(f, text="SHUTDOWN_COMMAND (e.g., systemctl poweroff):").grid(row=row, column=0, sticky="w")
         row += 1
-        self.shutdown_entry = tk.Entry(f, width=60)
+        self.shutdown_var = tk.StringVar()
+        self.shutdown_entry = tk.Entry(f, width=60, textvariable=self.shutdown_var)
         self.shutdown_entry.grid(row=row, column=0, sticky="we", pady=(0, 5))
         row += 1
 
         tk.Label(f, text="REBOOT_COMMAND:").grid(row=row, column=0, sticky="w")
         row += 1
-        self.reboot_entry = tk.Entry(f, width=60)
+        self.reboot_var = tk.StringVar()
+        self.reboot_entry = tk.Entry(f, width=60, textvariable=self.reboot_var)
         self.reboot_entry.grid(row=row, column=0, sticky="we", pady=(0, 5))
         row += 1
 
         tk.Label(f, text="SUSPEND_COMMAND:").grid(row=row, column=0, sticky="w")
         row += 1
-        self.suspend_entry = tk.Entry(f, width=60)
+        self.suspend_var = tk.StringVar()
+        self.suspend_entry = tk.Entry(f, width=60, textvariable=self.suspend_var)
         self.suspend_entry.grid(row=row, column=0, sticky="we", pady=(0, 5))
         row += 1
 
         tk.Label(f, text="LOGOUT_COMMAND:").grid(row=row, column=0, sticky="w")
         row += 1
-        self.logout_entry = tk.Entry(f, width=60)
+        self.logout_var = tk.StringVar()
+        self.logout_entry = tk.Entry(f, width=60, textvariable=self.logout_var)
         self.logout_entry.grid(row=row, column=0, sticky="we", pady=(0, 5))
         row += 1
 
@@ -836,59 +1025,53 @@ class EnvConfigFrame(tk.Frame):
 
         f.columnconfigure(0, weight=1)
 
-        # Fill current values
-        self.reload_system_from_env()
+        # Fill current values (from the env read in __init__)
+        self._fill_system_fields()
 
 
     def reload_system_from_env(self):
+        """'Reload from .env' button: force a real re-read from disk."""
+        read_env_file.cache_clear()
         self.env_values = read_env_file(ENV_PATH)
+        self._fill_system_fields()
 
-        self.listen_entry.delete(0, tk.END)
-        self.listen_entry.insert(0, self.env_values.get("LISTEN_DURATION", ""))
-
-        self.fuzzy_entry.delete(0, tk.END)
-        self.fuzzy_entry.insert(0, self.env_values.get("FUZZY_THRESHOLD", ""))
-
-        self.shutdown_entry.delete(0, tk.END)
-        self.shutdown_entry.insert(0, self.env_values.get("SHUTDOWN_COMMAND", ""))
-
-        self.reboot_entry.delete(0, tk.END)
-        self.reboot_entry.insert(0, self.env_values.get("REBOOT_COMMAND", ""))
-
-        self.suspend_entry.delete(0, tk.END)
-        self.suspend_entry.insert(0, self.env_values.get("SUSPEND_COMMAND", ""))
-
-        self.logout_entry.delete(0, tk.END)
-        self.logout_entry.insert(0, self.env_values.get("LOGOUT_COMMAND", ""))
+    def _fill_system_fields(self):
+        self.listen_var.set(self.env_values.get("LISTEN_DURATION", ""))
+        self.fuzzy_var.set(self.env_values.get("FUZZY_THRESHOLD", ""))
+        self.sensitivity_var.set(self.env_values.get("PORCUPINE_SENSITIVITY", ""))
+        self.shutdown_var.set(self.env_values.get("SHUTDOWN_COMMAND", ""))
+        self.reboot_var.set(self.env_values.get("REBOOT_COMMAND", ""))
+        self.suspend_var.set(self.env_values.get("SUSPEND_COMMAND", ""))
+        self.logout_var.set(self.env_values.get("LOGOUT_COMMAND", ""))
 
     def save_system_to_env(self):
         # Validation for duration and threshold
-        duration_str = self.listen_entry.get().strip()
-        threshold_str = self.fuzzy_entry.get().strip()
+        duration_str = self.listen_var.get().strip()
+        threshold_str = self.fuzzy_var.get().strip()
+        sensitivity_str = self.sensitivity_var.get().strip()
 
-        if duration_str:
-            if not duration_str.isdigit() or int(duration_str) < 1:
-                messagebox.showwarning("Validation Error", "LISTEN_DURATION must be a positive integer (seconds).")
-                return
+        if duration_str and not _DURATION_RE.match(duration_str):
+            messagebox.showwarning("Validation Error", "LISTEN_DURATION must be a positive integer (seconds).")
+            return
 
-        if threshold_str:
-            try:
-                threshold = float(threshold_str)
-                if not (0.0 <= threshold <= 1.0):
-                    raise ValueError
-            except ValueError:
-                messagebox.showwarning("Validation Error", "FUZZY_THRESHOLD must be a number between 0.0 and 1.0.")
-                return
+        if threshold_str and not _THRESHOLD_RE.match(threshold_str):
+            messagebox.showwarning("Validation Error", "FUZZY_THRESHOLD must be a number between 0.0 and 1.0.")
+            return
+
+        if sensitivity_str and not _THRESHOLD_RE.match(sensitivity_str):
+            messagebox.showwarning("Validation Error", "PORCUPINE_SENSITIVITY must be a number between 0.0 and 1.0.")
+            return
 
         updates = {
             "LISTEN_DURATION": duration_str,
             "FUZZY_THRESHOLD": threshold_str,
-            "SHUTDOWN_COMMAND": self.shutdown_entry.get().strip(),
-            "REBOOT_COMMAND": self.reboot_entry.get().strip(),
-            "SUSPEND_COMMAND": self.suspend_entry.get().strip(),
-            "LOGOUT_COMMAND": self.logout_entry.get().strip(),
+            "PORCUPINE_SENSITIVITY": sensitivity_str,
+            "SHUTDOWN_COMMAND": self.shutdown_var.get().strip(),
+            "REBOOT_COMMAND": self.reboot_var.get().strip(),
+            "SUSPEND_COMMAND": self.suspend_var.get().strip(),
+            "LOGOUT_COMMAND": self.logout_var.get().strip(),
         }
-        write_env_file(ENV_PATH, updates)
+        write_env_file(ENV_PATH, updates, current=self.env_values)
         messagebox.showinfo("Saved", "System / tuning settings saved to .env.")
 
 
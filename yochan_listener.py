@@ -2,16 +2,16 @@
 
 import os
 import sys
-import time
 import json
+import queue
+import re
+import signal
+import threading
 
-import pvporcupine
-from pvrecorder import PvRecorder
-from vosk import Model, KaldiRecognizer
-import sounddevice as sd
-
-from handlers import notify
-from ai_core import handle_voice_input
+# Keep BLAS single-threaded so Vosk doesn't fight Porcupine and the audio
+# callback for cores. Must be set before numpy / vosk are imported.
+for _var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "NUMEXPR_NUM_THREADS"):
+    os.environ.setdefault(_var, "1")
 
 from config import (
     MODEL_PATH,
@@ -19,9 +19,39 @@ from config import (
     ACCESS_KEY,
     WAKE_WORD_PATH,
     VOSK_SAMPLE_RATE,
+    PORCUPINE_SENSITIVITY,
     ASSISTANT_DISPLAY_NAME,
 )
 
+def prefetch_model(path):
+    """Ask the kernel to start reading the Vosk model files into the page
+    cache, so the disk I/O overlaps with the imports below instead of
+    happening inside Model()."""
+    if not path or not hasattr(os, "posix_fadvise"):
+        return
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                fd = os.open(os.path.join(root, name), os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+
+prefetch_model(MODEL_PATH)
+
+import numpy as np
+import pvporcupine
+from vosk import Model, KaldiRecognizer
+import sounddevice as sd
+
+from handlers import notify
+from ai_core import handle_voice_input
+
 # -------------------------------------------------
 # Validation
 # -------------------------------------------------
@@ -30,12 +60,33 @@ if not os.path.isdir(MODEL_PATH):
     print(f"Vosk model not found: {MODEL_PATH}", file=sys.stderr)
     sys.exit(1)
 
+# Commands are short, so the small (8-bit) Vosk models are accurate enough
+# and use a fraction of the memory and CPU of the large FP32 ones.
+if "small" not in os.path.basename(os.path.normpath(MODEL_PATH)).lower():
+    print(
+        f"[listener] Note: {MODEL_PATH} looks like a large Vosk model; "
+        "a vosk-model-small-* model is recommended for voice commands.",
+        file=sys.stderr,
+    )
+
 # -------------------------------------------------
 # Load Vosk model
 # -------------------------------------------------
 
 VOSK_MODEL = Model(MODEL_PATH)
 
+# One recognizer for the whole session; listen_for_command() resets it
+# instead of rebuilding the decoder state on every wake.
+RECOGNIZER = KaldiRecognizer(VOSK_MODEL, VOSK_SAMPLE_RATE)
+
+def warmup():
+    """Push a short burst of silence through the decoder so the first real
+    command doesn't pay the cold-start cost."""
+    RECOGNIZER.AcceptWaveform(bytes(VOSK_SAMPLE_RATE // 5 * 2))
+    RECOGNIZER.Reset()
+
+warmup()
+
 # -------------------------------------------------
 # Resolve wake word(s)
 # -------------------------------------------------
@@ -52,34 +103,124 @@ def resolve_keywords(path: str):
     raise RuntimeError("Invalid WAKE_WORD_PATH")
 
 KEYWORD_PATHS = resolve_keywords(WAKE_WORD_PATH)
+SENSITIVITIES = [PORCUPINE_SENSITIVITY] * len(KEYWORD_PATHS)
 
 # -------------------------------------------------
 # Speech capture (FREE FORM, STREAMING)
 # -------------------------------------------------
 
-def listen_for_command() -> str:
+# End-of-speech detection: stop as soon as the user goes quiet instead of
+# always recording for LISTEN_DURATION (which stays as the upper bound).
+SILENCE_THRESHOLD = 300     # RMS amplitude below this is silence
+TRAILING_SILENCE = 0.4      # seconds of silence after speech that end a command
+MIN_SPEECH = 0.25           # seconds of continuous voice before it counts as speech
+
+# Precomputed once; the per-command path only compares against these
+LISTEN_SAMPLES = VOSK_SAMPLE_RATE * LISTEN_DURATION
+SILENCE_SAMPLES = int(VOSK_SAMPLE_RATE * TRAILING_SILENCE)
+MIN_SPEECH_SAMPLES = int(VOSK_SAMPLE_RATE * MIN_SPEECH)
+_SILENCE_ENERGY = SILENCE_THRESHOLD ** 2
+_squares = np.empty(0, dtype=np.int32)
+
+def _is_speech(samples) -> bool:
+    """Mean-square energy test for one int16 frame. Squares go into a reused
+    int32 buffer, so no temporary array is allocated per frame."""
+    global _squares
+    n = len(samples)
+    if len(_squares) < n:
+        _squares = np.empty(n, dtype=np.int32)
+    squares = _squares[:n]
+    np.multiply(samples, samples, out=squares, dtype=np.int32)
+    return int(squares.sum(dtype=np.int64)) >= _SILENCE_ENERGY * n
+
+class _Endpointer:
+    """Per-command end-of-speech state: one feed() call per audio block
+    returns True once speech has been followed by TRAILING_SILENCE.
+
+    Speech only counts after MIN_SPEECH of continuous voice, so the tail of
+    the wake word in the first blocks after detection can't arm it."""
+
+    __slots__ = ("heard_speech", "voiced", "silent")
+
+    def __init__(self):
+        self.heard_speech = False
+        self.voiced = 0
+        self.silent = 0
+
+    def feed(self, samples) -> bool:
+        if _is_speech(samples):
+            self.voiced += len(samples)
+            if self.voiced >= MIN_SPEECH_SAMPLES:
+                self.heard_speech = True
+            self.silent = 0
+            return False
+        self.voiced = 0
+        if not self.heard_speech:
+            return False
+        self.silent += len(samples)
+        return self.silent >= SILENCE_SAMPLES
+
+# One capture stream feeds both Porcupine and Vosk. The audio callback only
+# queues blocks; all decoding happens on the main thread.
+WAKE_BATCH_FRAMES = 4      # Porcupine frames per audio block (~128 ms)
+AUDIO_QUEUE_SIZE = 32       # ~4 s of blocks
+
+def _enqueue_audio(audio_q, indata, status):
+    if status:
+        print(status, file=sys.stderr)
+    data = bytes(indata)
+    try:
+        audio_q.put_nowait(data)
+    except queue.Full:
+        # Consumer fell behind: drop the oldest block, keep the newest
+        try:
+            audio_q.get_nowait()
+            audio_q.put_nowait(data)
+        except (queue.Empty, queue.Full):
+            pass
+
+# Vosk results are flat JSON objects; pull "text" out directly and only fall
+# back to a full parse if it contains escapes.
+_TEXT_RE = re.compile(r'"text"\s*:\s*"([^"\\]*)"')
+
+def _result_text(result: str) -> str:
+    m = _TEXT_RE.search(result)
+    if m:
+        return m.group(1).strip()
+    return json.loads(result).get("text", "").strip()
+
+def listen_for_command(audio_q, pending: bytes = b"") -> str:
+    """Decode the command that follows the wake word, reading from the
+    shared capture queue until trailing silence or LISTEN_DURATION.
+    `pending` is the rest of the block the wake word was found in."""
     notify("STT", "Recording command...")
 
-    rec = KaldiRecognizer(VOSK_MODEL, VOSK_SAMPLE_RATE)
-    rec.SetWords(True)
+    rec = RECOGNIZER
+    rec.Reset()
 
     try:
-        def callback(indata, frames, time_info, status):
-            if status:
-                print(status, file=sys.stderr)
-            rec.AcceptWaveform(bytes(indata))
-
-        with sd.RawInputStream(
-            samplerate=VOSK_SAMPLE_RATE,
-            blocksize=16000,
-            dtype="int16",
-            channels=1,
-            callback=callback,
-        ):
-            time.sleep(LISTEN_DURATION)
-
-        result = json.loads(rec.FinalResult())
-        text = result.get("text", "").strip()
+        endpoint = _Endpointer()
+        captured = 0
+
+        # The rest of the wake block goes to Vosk only: it is mostly the end
+        # of the wake word and must not arm end-of-speech.
+        if pending:
+            rec.AcceptWaveform(pending)
+            captured += len(pending) // 2
+
+        while captured < LISTEN_SAMPLES:
+            try:
+                data = audio_q.get(timeout=1.0)
+            except queue.Empty:
+                break
+            rec.AcceptWaveform(data)
+
+            samples = np.frombuffer(data, dtype=np.int16)
+            captured += len(samples)
+            if endpoint.feed(samples):
+                break
+
+        text = _result_text(rec.FinalResult())
 
         if text:
             notify("STT", f"Heard: '{text}'")
@@ -96,52 +237,64 @@ def listen_for_command() -> str:
 # Main loop
 # -------------------------------------------------
 
+# Set by SIGTERM so the main loop can close the stream and release Porcupine
+# itself, instead of dying with the audio device half-open.
+_shutdown = threading.Event()
+
 def run_assistant_listener():
     notify("SYSTEM", "Starting YoChan")
+    signal.signal(signal.SIGTERM, lambda signum, frame: _shutdown.set())
 
     porcupine = pvporcupine.create(
         access_key=ACCESS_KEY,
         keyword_paths=KEYWORD_PATHS,
-        sensitivities=[0.9] * len(KEYWORD_PATHS),
+        sensitivities=SENSITIVITIES,
     )
 
-    recorder = PvRecorder(
-        device_index=-1,
-        frame_length=porcupine.frame_length,
+    # The stream stays open for the whole session: frames that arrive right
+    # after the wake word are already queued when the command decoder starts,
+    # so nothing is lost to a device stop/start. Blocks hold several
+    # Porcupine frames to cut callback wakeups; memoryview slices hand each
+    # frame over without copying or building a list of ints.
+    frame_length = porcupine.frame_length
+    audio_q = queue.Queue(maxsize=AUDIO_QUEUE_SIZE)
+    stream = sd.RawInputStream(
+        samplerate=porcupine.sample_rate,
+        blocksize=frame_length * WAKE_BATCH_FRAMES,
+        dtype="int16",
+        channels=1,
+        latency="low",
+        callback=lambda indata, frames, time_info, status: _enqueue_audio(audio_q, indata, status),
     )
-    recorder.start()
-
-    notify("SYSTEM", "Wake-word listener active", critical=True)
 
     try:
-        while True:
-            pcm = recorder.read()
-            if porcupine.process(pcm) >= 0:
-                notify("WAKE", "Wake word detected", critical=True)
-
-                try:
-                    recorder.stop()
-                except Exception:
-                    pass
-
-                text = listen_for_command()
-                if text:
-                    result = handle_voice_input(text)
-                    notify("RESULT", result)
-                else:
-                    notify("ERROR", "No command detected")
-
-                time.sleep(0.4)
+        with stream:
+            notify("SYSTEM", "Wake-word listener active", critical=True)
 
+            while not _shutdown.is_set():
                 try:
-                    recorder.start()
-                except Exception:
-                    pass
+                    data = audio_q.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                pcm = memoryview(data).cast("h")
+                for start in range(0, len(pcm) - frame_length + 1, frame_length):
+                    end = start + frame_length
+                    if porcupine.process(pcm[start:end]) < 0:
+                        continue
+
+                    notify("WAKE", "Wake word detected", critical=True)
+
+                    text = listen_for_command(audio_q, data[end * 2:])
+                    if text:
+                        result = handle_voice_input(text)
+                        notify("RESULT", result)
+                    else:
+                        notify("ERROR", "No command detected")
+                    break
 
     except KeyboardInterrupt:
         pass
     finally:
-        recorder.delete()
         porcupine.delete()
         sys.exit(0)
 
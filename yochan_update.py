@@ -20,21 +20,56 @@ Note:
 
 from __future__ import annotations
 
+import os
 import shutil
+import signal
 import subprocess
+import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 # ==============================
 # === CONFIG ===================
 # ==============================
 
 # 🔴 CHANGE THIS to your actual GitHub repo URL
-REPO_URL = "https://github.com/Dev-Akuma/YoCHAN.Ai.git"
+REPO_URL = "https://github.com/Dev-Akuma/YoCHAN.Ai.git".strip()
 
 # Default upstream ref (change to origin/master if you use master)
 UPSTREAM_REF = "origin/main"
+UPSTREAM_REMOTE, _, UPSTREAM_BRANCH = UPSTREAM_REF.partition("/")
+
+# Checked once at import: set, not the placeholder, and a remote git URL
+_REPO_URL_VALID = bool(
+    REPO_URL
+    and "your-username" not in REPO_URL
+    and REPO_URL.startswith(("https://", "git@", "ssh://"))
+)
+
+# History depth for the bootstrap clone. Users only need the current tree,
+# so 1 keeps the download small; set to 0 for a full clone (e.g. forks that
+# want history).
+CLONE_DEPTH = 1
+
+# Set to True if the repo ever gains submodules: clone/update then pull
+# them too. Either way, submodule and multi-remote fetches run in parallel.
+RECURSE_SUBMODULES = False
+FETCH_JOBS = 8
+_PARALLEL_FETCH = ["-c", f"submodule.fetchJobs={FETCH_JOBS}", "-c", f"fetch.parallel={FETCH_JOBS}"]
+
+# Repeated "Check for updates" clicks within this window reuse the last
+# remote answer instead of asking the remote again.
+REMOTE_CHECK_TTL_SECONDS = 30
 
 # Files we consider "user config" that should be preserved on clone/updates.
 # These are copied from old non-git installs to the new clone.
@@ -49,22 +84,118 @@ USER_CONFIG_FILES = [
 # === BASIC GIT HELPERS =======
 # ==============================
 
-def _run_git(args, cwd: Path) -> tuple[int, str]:
+# Long-running commands (clone, pull) keep only this many trailing lines
+MAX_OUTPUT_LINES = 200
+
+# A hung transport or a credential prompt must fail, not freeze the caller.
+# Local commands and ls-remote get a hard wall-clock limit; clone/fetch may
+# legitimately take longer, so they abort only when the transfer stalls
+# instead: under 1 KB/s for 30 s over HTTP(S), or ~30 s of unanswered
+# keepalives over SSH.
+GIT_TIMEOUT = 120  # seconds
+# SIGTERM first so git can remove index.lock and ref locks; SIGKILL after this
+GIT_KILL_GRACE = 5  # seconds
+# Returned instead of git's own exit code when git could not be run, was
+# killed on timeout, or its output could not be read
+GIT_FAILED = -1
+_SLOW_TRANSFER_ABORT = ["-c", "http.lowSpeedLimit=1000", "-c", "http.lowSpeedTime=30"]
+_SSH_COMMAND = (
+    "ssh -o BatchMode=yes -o ConnectTimeout=15"
+    " -o ServerAliveInterval=15 -o ServerAliveCountMax=2"
+)
+_GIT_ENV = {
+    **os.environ,
+    "GIT_TERMINAL_PROMPT": "0",
+    "GCM_INTERACTIVE": "Never",
+    # A user-supplied GIT_SSH_COMMAND (custom key, proxy) still wins
+    "GIT_SSH_COMMAND": os.environ.get("GIT_SSH_COMMAND") or _SSH_COMMAND,
+}
+
+
+def _start_git(args, cwd: Path, stream: bool = False) -> subprocess.Popen:
+    """
+    Start git. With `stream`, stderr is merged into stdout so
+    _finish_git() can read it line by line; otherwise the two stay
+    separate so callers can parse stdout.
+
+    git runs in its own session so a timeout can kill its transport helpers
+    (git-remote-https etc.) too; they hold the output pipes open.
+    """
+    return subprocess.Popen(
+        ["git"] + list(args),
+        cwd=str(cwd),
+        env=_GIT_ENV,
+        stdin=subprocess.DEVNULL,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT if stream else subprocess.PIPE,
+        start_new_session=True,
+    )
+
+
+def _finish_git(proc: subprocess.Popen, timeout: float | None = GIT_TIMEOUT) -> tuple[int, str]:
+    """Collect git's exit code and output; `timeout=None` disables the limit."""
+    timed_out = []
+    finished = threading.Event()
+
+    def _signal(sig):
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(proc.pid, sig)
+            elif sig == signal.SIGTERM:
+                proc.terminate()
+            else:
+                proc.kill()
+        except OSError:
+            pass
+
+    def _kill():
+        timed_out.append(True)
+        _signal(signal.SIGTERM)
+        if not finished.wait(GIT_KILL_GRACE):
+            _signal(getattr(signal, "SIGKILL", signal.SIGTERM))
+
+    timer = threading.Timer(timeout, _kill) if timeout else None
+    if timer:
+        timer.start()
     try:
-        result = subprocess.run(
-            ["git"] + list(args),
-            cwd=str(cwd),
-            text=True,
-            capture_output=True,
-            check=False,
-        )
-        out = result.stdout.strip() or result.stderr.strip()
-        return result.returncode, out
+        if proc.stderr is None:
+            # Streamed: constant memory however much git prints
+            tail = deque(proc.stdout, maxlen=MAX_OUTPUT_LINES)
+            proc.wait()
+            stdout, stderr = "".join(tail), ""
+        else:
+            stdout, stderr = proc.communicate()
+    except Exception as e:
+        return GIT_FAILED, str(e)
+    finally:
+        finished.set()
+        if timer:
+            timer.cancel()
+        for pipe in (proc.stdout, proc.stderr):
+            if pipe:
+                pipe.close()
+
+    if timed_out:
+        return GIT_FAILED, f"git timed out after {timeout} s."
+    out = stdout.strip() or stderr.strip()
+    return proc.returncode, out
+
+
+def _run_git(
+    args, cwd: Path, stream: bool = False, timeout: float | None = GIT_TIMEOUT
+) -> tuple[int, str]:
+    try:
+        proc = _start_git(args, cwd, stream)
     except Exception as e:
-        return 1, str(e)
+        return GIT_FAILED, str(e)
+    return _finish_git(proc, timeout)
 
 
+@lru_cache(maxsize=16)
 def _is_git_repo(path: Path) -> bool:
+    # Cached per path for the process lifetime; bootstrap clears it once the
+    # install has been swapped for a clone.
     return (path / ".git").is_dir()
 
 
@@ -72,7 +203,201 @@ def _is_git_repo(path: Path) -> bool:
 # === NON-GIT → GIT CLONE =====
 # ==============================
 
-def bootstrap_convert_to_git_clone(base_dir: Path) -> tuple[bool, str]:
+# FICLONE ioctl number (fcntl only exports it from Python 3.12)
+_FICLONE = getattr(fcntl, "FICLONE", 0x40049409) if fcntl else None
+
+
+def _fast_copy(src, dst: Path) -> None:
+    """
+    Copy src to dst as a reflink when the filesystem supports it (btrfs,
+    XFS), so no data passes through userspace. Falls back to shutil.copy2,
+    which already uses fcopyfile on macOS and CopyFile2 on Windows.
+    """
+    if _FICLONE and sys.platform.startswith("linux"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+
+def _robust_rename(src: Path, dst: Path, attempts: int = 5, delay: float = 0.1) -> None:
+    """
+    os.replace() with exponential backoff (0.1, 0.2, 0.4, 0.8 s), for
+    Windows, where antivirus scanners or open handles briefly lock folders.
+    Re-raises the last error if every attempt fails.
+    """
+    for attempt in range(attempts):
+        try:
+            os.replace(src, dst)
+            return
+        except OSError:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(delay * (2 ** attempt))
+
+
+def _set_aside_failed_clone(clone_dir: Path, timestamp: str) -> None:
+    # Rename instead of rmtree: cheap, and nothing is lost if it was us
+    # that got something wrong.
+    try:
+        if clone_dir.exists():
+            _robust_rename(clone_dir, clone_dir.with_name(f"{clone_dir.name}.failed_{timestamp}"))
+    except Exception:
+        pass
+
+
+def _find_user_files(base_dir: Path) -> dict[str, os.DirEntry]:
+    """
+    Map each USER_CONFIG_FILES entry present in base_dir to its DirEntry,
+    using one scandir per containing folder instead of stat calls per file.
+    """
+    by_parent: dict[str, dict[str, str]] = {}
+    for rel in USER_CONFIG_FILES:
+        parent, _, name = rel.rpartition("/")
+        by_parent.setdefault(parent, {})[name] = rel
+
+    found = {}
+    for parent, names in by_parent.items():
+        try:
+            with os.scandir(base_dir / parent) as it:
+                for entry in it:
+                    rel = names.get(entry.name)
+                    if rel and entry.is_file():
+                        found[rel] = entry
+        except OSError:
+            continue
+    return found
+
+
+def _copy_user_file(src: os.DirEntry, dst: Path) -> str | None:
+    """Copy one user config file; return a warning line on failure."""
+    try:
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        _fast_copy(src, dst)
+    except Exception as e:
+        return f"{src.path} -> {dst}: {e}"
+    return None
+
+
+def _do_clone(parent: Path, clone_dir: Path) -> tuple[bool, str]:
+    # Shallow + blobless unless CLONE_DEPTH is 0
+    clone_args = _PARALLEL_FETCH + ["clone", "--quiet", "--single-branch", "--no-tags"]
+    if CLONE_DEPTH:
+        clone_args += [f"--depth={CLONE_DEPTH}", "--filter=blob:none"]
+    if RECURSE_SUBMODULES:
+        clone_args += ["--recurse-submodules", "--shallow-submodules" if CLONE_DEPTH else "--no-shallow-submodules"]
+    code, out = _run_git(
+        _SLOW_TRANSFER_ABORT + clone_args + [REPO_URL, str(clone_dir)],
+        cwd=parent,
+        stream=True,
+        timeout=None,
+    )
+    if code != 0:
+        return False, f"Failed to clone YoChan repo from {REPO_URL}:\n{out}"
+    return True, ""
+
+
+def _copy_configs(base_dir: Path, clone_dir: Path) -> list[str]:
+    """Copy user config files concurrently; return warnings for failures."""
+    user_files = _find_user_files(base_dir)
+    if not user_files:
+        return []
+    with ThreadPoolExecutor(max_workers=min(8, len(user_files))) as pool:
+        results = pool.map(
+            lambda item: _copy_user_file(item[1], clone_dir / item[0]),
+            user_files.items(),
+        )
+        return [r for r in results if r]
+
+
+_RENAME_EXCHANGE = 2
+_AT_FDCWD = -100
+
+
+def _exchange_dirs(a: Path, b: Path) -> bool:
+    """
+    Atomically swap two directories with renameat2(RENAME_EXCHANGE)
+    (Linux >= 3.15, glibc >= 2.28). Returns False when unsupported so the
+    caller can fall back to two plain renames.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        import ctypes
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        renameat2 = libc.renameat2
+    except (OSError, AttributeError):
+        return False
+    renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    return renameat2(_AT_FDCWD, os.fsencode(a), _AT_FDCWD, os.fsencode(b), _RENAME_EXCHANGE) == 0
+
+
+def _swap_dirs(base_dir: Path, clone_dir: Path, backup_dir: Path, timestamp: str) -> tuple[bool, str]:
+    """
+    Put the clone at base_dir and keep the old install as a backup.
+    Returns (success, error message or, on success, the backup folder).
+    """
+    # Preferred: one atomic exchange, so base_dir never disappears. The old
+    # install then sits at clone_dir until it is renamed to the backup name.
+    if _exchange_dirs(clone_dir, base_dir):
+        _is_git_repo.cache_clear()
+        try:
+            _robust_rename(clone_dir, backup_dir)
+        except Exception:
+            return True, str(clone_dir)
+        return True, str(backup_dir)
+
+    # Fallback: move old folder aside as backup
+    try:
+        _robust_rename(base_dir, backup_dir)
+    except Exception as e:
+        # Rollback: set the clone aside
+        _set_aside_failed_clone(clone_dir, timestamp)
+        return False, f"Failed to move old YoChan folder to backup:\n{e}"
+
+    # Move clone folder into original name
+    try:
+        _robust_rename(clone_dir, base_dir)
+    except Exception as e:
+        # Try to rollback: move backup back, set the clone aside
+        try:
+            _robust_rename(backup_dir, base_dir)
+        except Exception:
+            pass
+        _set_aside_failed_clone(clone_dir, timestamp)
+        return False, f"Failed to move new clone into place:\n{e}"
+
+    _is_git_repo.cache_clear()
+    return True, str(backup_dir)
+
+
+def _repack_in_background(repo_dir: Path) -> None:
+    """
+    A partial clone ends up with a promisor pack plus a second pack for the
+    blobs fetched at checkout. Fold them into one pack so later status /
+    ls-remote / pull calls have fewer packs to search. Detached and not
+    waited on; any failure just leaves the packs as they are.
+    """
+    try:
+        subprocess.Popen(
+            ["git", "repack", "-A", "-d", "-q"],
+            cwd=str(repo_dir),
+            env=_GIT_ENV,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except Exception:
+        pass
+
+
+def bootstrap_convert_to_git_clone(base_dir: Path, progress=None) -> tuple[bool, str]:
     """
     Convert a non-git YoChan install into a proper git clone:
 
@@ -82,9 +407,13 @@ def bootstrap_convert_to_git_clone(base_dir: Path) -> tuple[bool, str]:
     3. Copy user config files from old folder into new clone.
     4. Move old folder to backup, move new clone to original name.
 
+    `progress`, if given, is called with a short description as each
+    stage starts (from the calling thread).
+
     Returns:
         (success, message)
     """
+    report = progress or (lambda stage: None)
 
     if _is_git_repo(base_dir):
         return False, "This install is already a git clone; no conversion needed."
@@ -92,15 +421,17 @@ def bootstrap_convert_to_git_clone(base_dir: Path) -> tuple[bool, str]:
     parent = base_dir.parent
     name = base_dir.name
 
-    if not REPO_URL or "your-username" in REPO_URL:
+    if not _REPO_URL_VALID:
         return (
             False,
             "REPO_URL is not configured in yochan_update.py.\n"
-            "Please set it to your actual GitHub repository URL.",
+            "Please set it to your actual GitHub repository URL "
+            "(https://, ssh:// or git@).",
         )
 
     # Paths for new clone + backup
-    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    # Nanosecond hex stamp: unique even for two attempts in the same second
+    timestamp = f"{time.time_ns():x}"
     backup_dir = parent / f"{name}_backup_{timestamp}"
     clone_dir = parent / f"{name}_new_clone"
 
@@ -108,63 +439,67 @@ def bootstrap_convert_to_git_clone(base_dir: Path) -> tuple[bool, str]:
         return False, f"Temporary clone directory already exists: {clone_dir}"
 
     # 1. Clone
-    code, out = _run_git(["clone", REPO_URL, str(clone_dir)], cwd=parent)
-    if code != 0:
-        return False, f"Failed to clone YoChan repo from {REPO_URL}:\n{out}"
+    report("Cloning YoChan repository...")
+    ok, msg = _do_clone(parent, clone_dir)
+    if not ok:
+        return False, msg
 
-    # 2. Copy user config files from old install to new clone
-    for rel in USER_CONFIG_FILES:
-        src = base_dir / rel
-        dst = clone_dir / rel
-        if src.exists() and src.is_file():
-            try:
-                dst.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src, dst)
-            except Exception as e:
-                # We don't fail hard on user-file copy; just warn in message.
-                print(f"[YoChan updater] Failed to copy user config {src} -> {dst}: {e}")
-
-    # 3. Move old folder aside as backup
-    try:
-        base_dir.rename(backup_dir)
-    except Exception as e:
-        # Rollback: remove clone_dir?
-        try:
-            shutil.rmtree(clone_dir)
-        except Exception:
-            pass
-        return False, f"Failed to move old YoChan folder to backup:\n{e}"
+    # 2. Copy user config files (we don't fail hard on a user-file copy,
+    # just warn in the message)
+    report("Copying user config files...")
+    copy_failures = _copy_configs(base_dir, clone_dir)
 
-    # 4. Move clone folder into original name
-    try:
-        clone_dir.rename(base_dir)
-    except Exception as e:
-        # Try to rollback: move backup back, remove clone_dir
-        try:
-            backup_dir.rename(base_dir)
-        except Exception:
-            pass
-        try:
-            if clone_dir.exists():
-                shutil.rmtree(clone_dir)
-        except Exception:
-            pass
-        return False, f"Failed to move new clone into place:\n{e}"
+    # 3. Swap the clone into place, keeping the old folder as backup
+    report("Swapping folders...")
+    ok, swap_result = _swap_dirs(base_dir, clone_dir, backup_dir, timestamp)
+    if not ok:
+        return False, swap_result
+
+    if CLONE_DEPTH:
+        _repack_in_background(base_dir)
 
     msg = (
         "YoChan install has been converted into a git-managed clone.\n"
-        f"A backup of your previous folder is at:\n{backup_dir}\n\n"
+        f"A backup of your previous folder is at:\n{swap_result}\n\n"
         "Your user config files (like .env, yochan_apps.user.json) were copied over "
         "when possible.\n"
         "You can now use 'Check for updates' for seamless future updates."
     )
+    if copy_failures:
+        report_lines = "\n".join(copy_failures)
+        sys.stderr.write(f"[YoChan updater] Failed to copy user config:\n{report_lines}\n")
+        msg += "\n\nSome user config files could not be copied:\n" + report_lines
     return True, msg
 
 
+# One worker: conversions never run concurrently
+_bootstrap_executor = ThreadPoolExecutor(max_workers=1)
+
+
+def bootstrap_convert_to_git_clone_async(base_dir: Path, progress=None) -> Future:
+    """
+    Run bootstrap_convert_to_git_clone() on a background thread so a UI can
+    stay responsive during the clone. The Future resolves to the same
+    (success, message) tuple; `progress` is called from the worker thread.
+    """
+    return _bootstrap_executor.submit(bootstrap_convert_to_git_clone, base_dir, progress)
+
+
 # ==============================
 # === UPDATE CHECKING =========
 # ==============================
 
+# repo_dir -> (time.monotonic() of the answer, remote branch tip SHA)
+_remote_tips: dict[Path, tuple[float, str]] = {}
+
+
+def _cached_remote_tip(repo_dir: Path) -> str | None:
+    cached = _remote_tips.get(repo_dir)
+    if cached and time.monotonic() - cached[0] < REMOTE_CHECK_TTL_SECONDS:
+        return cached[1]
+    return None
+
+
 def check_for_updates(repo_dir: Path) -> tuple[bool, bool, str, bool]:
     """
     Return (has_updates, is_dirty, status_message, is_git).
@@ -185,29 +520,49 @@ def check_for_updates(repo_dir: Path) -> tuple[bool, bool, str, bool]:
             False,
         )
 
-    # Check for local modifications (tracked files)
-    code, status_out = _run_git(["status", "--porcelain"], repo_dir)
+    # Unless we asked recently, ask the remote for its branch tip in the
+    # background while status walks the work tree. ls-remote downloads no
+    # objects; apply_updates() fetches.
+    upstream = _cached_remote_tip(repo_dir)
+    remote = None
+    if upstream is None:
+        try:
+            remote = _start_git(
+                ["ls-remote", UPSTREAM_REMOTE, f"refs/heads/{UPSTREAM_BRANCH}"], repo_dir
+            )
+        except Exception as e:
+            return False, False, f"Failed to contact remote for updates:\n{e}", True
+
+    # One status call gives both local modifications and the HEAD commit
+    code, status_out = _run_git(["status", "--porcelain=v2", "--branch"], repo_dir)
+    if remote is not None:
+        remote_code, remote_out = _finish_git(remote)
     if code != 0:
         return False, False, f"Failed to read git status:\n{status_out}", True
 
-    is_dirty = bool(status_out.strip())
-
-    # Fetch latest info
-    code, fetch_out = _run_git(["fetch", "origin"], repo_dir)
-    if code != 0:
-        return False, is_dirty, f"Failed to contact remote for updates:\n{fetch_out}", True
+    local = ""
+    is_dirty = False
+    for line in status_out.splitlines():
+        if line.startswith("# branch.oid "):
+            local = line[len("# branch.oid "):]
+        elif line and not line.startswith("#"):
+            is_dirty = True
+
+    if remote is not None:
+        if remote_code != 0:
+            return False, is_dirty, f"Failed to contact remote for updates:\n{remote_out}", True
+
+        upstream = remote_out.split(maxsplit=1)[0] if remote_out else ""
+        if not upstream:
+            return False, is_dirty, (
+                f"Failed to read upstream reference {UPSTREAM_REF}.\n"
+                "Make sure your 'origin' is configured and has a 'main' (or master) branch."
+            ), True
+        _remote_tips[repo_dir] = (time.monotonic(), upstream)
 
     # Compare local HEAD vs upstream
-    code, local = _run_git(["rev-parse", "HEAD"], repo_dir)
-    if code != 0:
-        return False, is_dirty, f"Failed to read local HEAD:\n{local}", True
-
-    code, upstream = _run_git(["rev-parse", UPSTREAM_REF], repo_dir)
-    if code != 0:
-        return False, is_dirty, (
-            f"Failed to read upstream reference {UPSTREAM_REF}:\n{upstream}\n"
-            "Make sure your 'origin' is configured and has a 'main' (or master) branch."
-        ), True
+    if not local or local == "(initial)":
+        return False, is_dirty, "Failed to read local HEAD.", True
 
     if local == upstream:
         if is_dirty:
@@ -234,18 +589,67 @@ def check_for_updates(repo_dir: Path) -> tuple[bool, bool, str, bool]:
     return True, False, "A new version of YoChan is available.", True
 
 
-def apply_updates(repo_dir: Path) -> tuple[bool, str]:
+def apply_updates(repo_dir: Path, upstream_sha: str | None = None) -> tuple[bool, str]:
     """
-    Apply updates from remote using `git pull --ff-only`.
+    Fast-forward to the remote branch. This is where the objects actually get
+    downloaded (the update check only uses ls-remote): fetch the tracked
+    branch, confirm HEAD is an ancestor of it, then `git merge --ff-only`.
+
+    `upstream_sha` pins the update to the commit a previous check saw;
+    by default the freshly fetched tip is used.
 
     Returns (success, message).
     """
     if not _is_git_repo(repo_dir):
         return False, "Cannot update: this directory is not a git clone."
 
-    code, out = _run_git(["pull", "--ff-only"], repo_dir)
+    code, out = _run_git(
+        _SLOW_TRANSFER_ABORT
+        + _PARALLEL_FETCH
+        + ["fetch", "--quiet", "--no-tags", UPSTREAM_REMOTE, UPSTREAM_BRANCH],
+        repo_dir,
+        stream=True,
+        timeout=None,
+    )
+    if code != 0:
+        return False, f"git fetch failed:\n{out}"
+
+    target = upstream_sha or "FETCH_HEAD"
+
+    # git's own exit code 1 means "not an ancestor": local history has
+    # diverged. Timeouts and spawn errors come back as GIT_FAILED instead.
+    code, out = _run_git(["merge-base", "--is-ancestor", "HEAD", target], repo_dir)
+    if code == 1:
+        return False, (
+            "Cannot update automatically: your local YoChan branch has commits "
+            f"that are not on {UPSTREAM_REF}.\n"
+            "Please rebase or reset your local changes first."
+        )
     if code != 0:
-        return False, f"git pull failed:\n{out}"
+        return False, f"Failed to compare local and remote history:\n{out}"
+
+    # Blobless clones (see bootstrap) download the new blobs during checkout,
+    # so the merge is a transfer too
+    code, out = _run_git(
+        _SLOW_TRANSFER_ABORT + ["merge", "--ff-only", "--quiet", target],
+        repo_dir,
+        stream=True,
+        timeout=None,
+    )
+    if code != 0:
+        return False, f"git merge failed:\n{out}"
+
+    if RECURSE_SUBMODULES:
+        code, out = _run_git(
+            _SLOW_TRANSFER_ABORT
+            + _PARALLEL_FETCH
+            + ["submodule", "update", "--init", "--recursive", "--quiet", f"--jobs={FETCH_JOBS}"],
+            repo_dir,
+            stream=True,
+            timeout=None,
+        )
+        if code != 0:
+            return False, f"Updated YoChan, but updating submodules failed:\n{out}"
 
     return True, "YoChan has been updated to the latest version.\nPlease restart the listener."
 
@@ -254,8 +658,12 @@ def apply_updates(repo_dir: Path) -> tuple[bool, str]:
 # === CLI USAGE (OPTIONAL) ====
 # ==============================
 
+# Absolute but not symlink-resolved: enough for git's cwd and for the
+# bootstrap's parent/name split, without a realpath() walk.
+_HERE = Path(os.path.dirname(os.path.abspath(__file__)))
+
 if __name__ == "__main__":
-    here = Path(__file__).resolve().parent
+    here = _HERE
     has_updates, is_dirty, msg, is_git = check_for_updates(here)
     print(msg)
 